@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import typing
 from importlib import metadata as importlib_metadata
 
-from releez.git_repo import DetectedRelease, detect_release_from_branch
+if typing.TYPE_CHECKING:
+    from releez.git_repo import DetectedRelease, detect_release_from_branch
 
 __version__ = importlib_metadata.version('releez')
 
@@ -11,3 +13,20 @@ __all__ = [
     '__version__',
     'detect_release_from_branch',
 ]
+
+_GIT_REPO_EXPORTS = ('DetectedRelease', 'detect_release_from_branch')
+
+
+def __getattr__(name: str) -> object:
+    """Lazily resolve re-exports so importing releez stays cheap.
+
+    The git_repo module (and its git/semver dependencies) is only imported
+    when one of its re-exported names is actually accessed, keeping CLI
+    startup paths like `releez --help` fast.
+    """
+    if name in _GIT_REPO_EXPORTS:
+        from releez import git_repo  # noqa: PLC0415
+
+        return getattr(git_repo, name)
+    msg = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(msg)
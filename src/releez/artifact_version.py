@@ -30,7 +30,7 @@ class PrereleaseType(StrEnum):
     rc = 'rc'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArtifactVersionInput:
     """Inputs for computing an artifact version.
 
@@ -3,26 +3,46 @@ from __future__ import annotations
 from cyclopts import App
 
 from releez import __version__
-from releez.subapps import (
-    changelog_app,
-    doctor_app,
-    projects_app,
-    release_app,
-    validate_app,
-    version_app,
-)
 
 app = App(
     name='releez',
     help='CLI tool for helping to manage release processes.',
     version=f'releez {__version__}',
 )
-app.command(release_app)
-app.command(version_app)
-app.command(changelog_app)
-app.command(projects_app)
-app.command(validate_app)
-app.command(doctor_app)
+
+# Sub-apps are registered lazily via import paths so that an invocation only
+# imports the modules backing the dispatched subcommand. This keeps cheap
+# paths like `releez --help` from paying for git/pydantic/semver imports.
+app.command(
+    'releez.subapps.release:release_app',
+    name='release',
+    help='Release workflows (changelog + branch + PR).',
+)
+app.command(
+    'releez.subapps.version:version_app',
+    name='version',
+    help='Version utilities for CI/artifacts.',
+)
+app.command(
+    'releez.subapps.changelog:changelog_app',
+    name='changelog',
+    help='Changelog utilities.',
+)
+app.command(
+    'releez.subapps.projects:projects_app',
+    name='projects',
+    help='Monorepo project utilities.',
+)
+app.command(
+    'releez.subapps.validate:validate_app',
+    name='validate',
+    help='Validate commit messages against cliff.toml rules.',
+)
+app.command(
+    'releez.subapps.doctor:doctor_app',
+    name='doctor',
+    help='Check releez configuration and environment.',
+)
 
 
 def main() -> None:
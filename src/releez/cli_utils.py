@@ -7,6 +7,7 @@ from semver import VersionInfo
 from releez.cliff import GitCliff
 from releez.console import err_console
 from releez.errors import InvalidReleaseVersionError
+from releez.version_tags import _parse_simple_version
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -60,6 +61,9 @@ def _resolve_release_version(
         )
     if tag_prefix and raw.startswith(tag_prefix):
         raw = raw.removeprefix(tag_prefix)
+    parsed = _parse_simple_version(raw)
+    if parsed is not None:
+        return parsed
     try:
         return VersionInfo.parse(raw)
     except ValueError as exc:
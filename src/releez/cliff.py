@@ -25,7 +25,7 @@ GIT_CLIFF_TAG_PATTERN = '^[0-9]+\\.[0-9]+\\.[0-9]+$'
 GitCliffBump = Literal['major', 'minor', 'patch', 'auto']
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReleaseNotes:
     """Generated release notes from git-cliff."""
 
@@ -33,7 +33,7 @@ class ReleaseNotes:
     markdown: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommitValidationResult:
     """Result of validating a commit message against the project's cliff.toml parsers."""
 
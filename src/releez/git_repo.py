@@ -4,6 +4,7 @@ import re
 import typing
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from git import Repo
@@ -28,7 +29,7 @@ if typing.TYPE_CHECKING:
 GIT_BIN = 'git'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoInfo:
     """Information about a Git repository.
 
@@ -44,7 +45,7 @@ class RepoInfo:
     active_branch: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoContext:
     """Bundle a repository with its derived metadata.
 
@@ -255,6 +256,16 @@ def push_tags(
     repo.git.push(remote_name, *tags)
 
 
+@lru_cache(maxsize=32)
+def _compile_tag_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a tag regex, reusing compiled patterns across calls.
+
+    The same handful of tag patterns get recompiled by every command that
+    scans tags; the cache makes repeat lookups free.
+    """
+    return re.compile(pattern)
+
+
 def _build_commit_to_tags_map(
     repo: Repo,
     compiled_pattern: re.Pattern[str],
@@ -269,12 +280,10 @@ def _build_commit_to_tags_map(
         Dict mapping commit SHA to list of matching tag names on that commit.
     """
     commit_to_tags: dict[str, list[str]] = {}
+    matches = compiled_pattern.match
     for tag in repo.tags:
-        if compiled_pattern.match(tag.name):
-            sha = tag.commit.hexsha
-            if sha not in commit_to_tags:
-                commit_to_tags[sha] = []
-            commit_to_tags[sha].append(tag.name)
+        if matches(tag.name):
+            commit_to_tags.setdefault(tag.commit.hexsha, []).append(tag.name)
     return commit_to_tags
 
 
@@ -319,7 +328,8 @@ def _find_tag_by_date(
     Returns:
         Most recently committed tag name, or None if no tags match.
     """
-    all_tags = [(tag, tag.commit.committed_datetime) for tag in repo.tags if compiled_pattern.match(tag.name)]
+    matches = compiled_pattern.match
+    all_tags = [(tag, tag.commit.committed_datetime) for tag in repo.tags if matches(tag.name)]
     if all_tags:
         all_tags.sort(key=lambda x: x[1], reverse=True)
         return all_tags[0][0].name
@@ -336,7 +346,7 @@ def find_latest_tag_matching_pattern(repo: Repo, *, pattern: str) -> str | None:
     Returns:
         The most recent tag name matching the pattern, or None if no tags match.
     """
-    compiled_pattern = re.compile(pattern)
+    compiled_pattern = _compile_tag_pattern(pattern)
     commit_to_tags = _build_commit_to_tags_map(repo, compiled_pattern)
 
     if not commit_to_tags:
@@ -359,13 +369,12 @@ def find_all_major_versions(repo: Repo, *, tag_prefix: str) -> list[int]:
     Returns:
         Sorted list of major version integers (e.g., [1, 2, 3]).
     """
-    compiled = re.compile(generate_tag_pattern(tag_prefix))
+    matches = _compile_tag_pattern(generate_tag_pattern(tag_prefix)).match
     majors: set[int] = set()
     for tag in repo.tags:
-        m = compiled.match(tag.name)
+        m = matches(tag.name)
         if m:
-            parsed = VersionInfo.parse(m.group(1))
-            majors.add(parsed.major)
+            majors.add(VersionInfo.parse(m.group(1)).major)
     return sorted(majors)
 
 
@@ -591,7 +600,7 @@ def get_changed_files_per_project(
     return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetectedRelease:
     """Information parsed from a release branch name.
 
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import os
-import re
+import typing
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from releez.errors import InvalidGitHubRemoteError, MissingGitHubDependencyError
 
+if typing.TYPE_CHECKING:
+    from github import Github
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PullRequest:
     """A minimal representation of a created GitHub pull request.
 
@@ -21,7 +25,7 @@ class PullRequest:
     number: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PullRequestCreateRequest:
     """Parameters for creating a GitHub pull request.
 
@@ -44,15 +48,24 @@ class PullRequestCreateRequest:
     labels: list[str]
 
 
-_SCP_SSH_RE = re.compile(
-    r'^git@(?P<host>[^:]+):(?P<full>[^/]+/[^/]+?)(?:\\.git)?$',
-)
-_SSH_URL_RE = re.compile(
-    r'^ssh://git@(?P<host>[^/]+)/(?P<full>[^/]+/[^/]+?)(?:\\.git)?$',
-)
-_HTTPS_RE = re.compile(
-    r'^https?://(?P<host>[^/]+)/(?P<full>[^/]+/[^/]+?)(?:\\.git)?$',
-)
+# URL-style remote prefixes and their host/path separator. SCP-style
+# (git@host:owner/repo) is handled separately since it splits on ':'.
+_URL_REMOTE_PREFIXES = ('ssh://git@', 'https://', 'http://')
+
+
+def _split_remote_host_path(remote_url: str) -> tuple[str, str] | None:
+    """Split a git remote URL into (host, path) using plain string ops.
+
+    Returns None if the URL matches no supported remote format.
+    """
+    if remote_url.startswith('git@'):
+        host, sep, path = remote_url.removeprefix('git@').partition(':')
+        return (host, path) if sep and host else None
+    for prefix in _URL_REMOTE_PREFIXES:
+        if remote_url.startswith(prefix):
+            host, sep, path = remote_url.removeprefix(prefix).partition('/')
+            return (host, path) if sep and host else None
+    return None
 
 
 def _github_api_base_url_from_env() -> str | None:
@@ -125,19 +138,39 @@ def _parse_github_full_name(remote_url: str) -> str:
     Raises:
         InvalidGitHubRemoteError: If URL format is unrecognized or host is not allowed.
     """
-    # Try each URL format in order; first match wins
     remote_url = remote_url.strip()
-    for regex in (_SCP_SSH_RE, _SSH_URL_RE, _HTTPS_RE):
-        m = regex.match(remote_url)
-        if m:
-            host = m.group('host')
-            if host not in _allowed_github_hosts_from_env():
-                raise InvalidGitHubRemoteError(remote_url)
-            full_name = m.group('full')
-            if full_name.endswith('.git'):
-                full_name = full_name.removesuffix('.git')
-            return full_name
-    raise InvalidGitHubRemoteError(remote_url)
+    host_path = _split_remote_host_path(remote_url)
+    if host_path is None:
+        raise InvalidGitHubRemoteError(remote_url)
+    host, path = host_path
+    if host not in _allowed_github_hosts_from_env():
+        raise InvalidGitHubRemoteError(remote_url)
+    full_name = path.removesuffix('.git')
+    owner, sep, repo = full_name.partition('/')
+    if not (sep and owner and repo) or '/' in repo:
+        raise InvalidGitHubRemoteError(remote_url)
+    return full_name
+
+
+@lru_cache(maxsize=4)
+def _github_client(*, token: str, base_url: str | None) -> Github:
+    """Build an authenticated PyGithub client, reusing it across calls.
+
+    PyGithub is imported here (not at module load) so the rest of releez
+    works without it installed; repeated PR operations in one process share
+    the client and its underlying connection pool.
+
+    Raises:
+        MissingGitHubDependencyError: If PyGithub is not installed.
+    """
+    try:
+        from github import Github  # noqa: PLC0415
+    except ImportError as exc:
+        raise MissingGitHubDependencyError from exc
+
+    if base_url:
+        return Github(login_or_token=token, base_url=base_url)
+    return Github(token)
 
 
 def create_pull_request(request: PullRequestCreateRequest) -> PullRequest:
@@ -153,20 +186,10 @@ def create_pull_request(request: PullRequestCreateRequest) -> PullRequest:
         MissingGitHubDependencyError: If PyGithub is not installed.
         InvalidGitHubRemoteError: If the remote URL cannot be mapped to a GitHub repo.
     """
-    try:
-        from github import Github  # noqa: PLC0415
-    except ImportError as exc:
-        raise MissingGitHubDependencyError from exc
-
     full_name = _parse_github_full_name(request.remote_url)
-    base_url = _github_api_base_url_from_env()
-    gh = (
-        Github(
-            login_or_token=request.token,
-            base_url=base_url,
-        )
-        if base_url
-        else Github(request.token)
+    gh = _github_client(
+        token=request.token,
+        base_url=_github_api_base_url_from_env(),
     )
     repo = gh.get_repo(full_name)
     pr = repo.create_pull(
@@ -29,7 +29,7 @@ from releez.utils import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartReleaseResult:
     """Result of starting a release.
 
@@ -46,7 +46,7 @@ class StartReleaseResult:
     pr_url: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartReleaseInput:
     """Inputs for starting a release.
 
@@ -105,7 +105,7 @@ class StartReleaseInput:
         return generate_tag_pattern(self.tag_prefix) if self.tag_prefix else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _MaybeCreatePullRequestInput:
     """Inputs for optionally creating a pull request.
 
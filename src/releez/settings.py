@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import warnings
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -201,7 +202,7 @@ class ReleezSettings(BaseSettings):
         """Return True if any projects are configured (monorepo mode)."""
         return bool(self.projects)
 
-    @property
+    @cached_property
     def effective_maintenance_branch_regex(self) -> str:
         r"""Return the active maintenance branch regex, applying a smart default if unset.
 
@@ -214,7 +215,7 @@ class ReleezSettings(BaseSettings):
             return r'^support/(?P<prefix>[^\d]+-)?(?P<major>\d+)\.x$'
         return r'^support/(?P<major>\d+)\.x$'
 
-    @property
+    @cached_property
     def effective_maintenance_branch_template(self) -> str:
         """Return the active branch name template, applying a smart default if unset.
 
@@ -365,3 +366,25 @@ class ReleezSettings(BaseSettings):
             releez_toml,
             pyproject_toml,
         )
+
+
+@lru_cache(maxsize=8)
+def _load_settings(cwd: Path) -> ReleezSettings:
+    """Construct settings once per working directory.
+
+    Settings are resolved from config files relative to the working
+    directory, so the cache key is the directory the command runs in.
+    Use ``_load_settings.cache_clear()`` to force a reload.
+    """
+    _ = cwd
+    return ReleezSettings()
+
+
+def get_settings() -> ReleezSettings:
+    """Load releez settings for the current working directory.
+
+    Command bodies should use this accessor instead of constructing
+    ReleezSettings directly; repeated in-process invocations from the same
+    directory reuse the already-validated settings instance.
+    """
+    return _load_settings(Path.cwd())
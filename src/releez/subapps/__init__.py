@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import releez.subapps.release_notes
-import releez.subapps.release_preview
-import releez.subapps.release_start
-import releez.subapps.release_support
-import releez.subapps.release_tag  # noqa: F401 — triggers command registration on release_app
-from releez.subapps.changelog import changelog_app
-from releez.subapps.doctor import doctor_app
-from releez.subapps.projects import projects_app
-from releez.subapps.release import release_app
-from releez.subapps.validate import validate_app
-from releez.subapps.version import version_app
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from releez.subapps.changelog import changelog_app
+    from releez.subapps.doctor import doctor_app
+    from releez.subapps.projects import projects_app
+    from releez.subapps.release import release_app
+    from releez.subapps.validate import validate_app
+    from releez.subapps.version import version_app
 
 __all__ = [
     'changelog_app',
@@ -20,3 +19,26 @@ __all__ = [
     'validate_app',
     'version_app',
 ]
+
+_APP_MODULES = {
+    'changelog_app': 'releez.subapps.changelog',
+    'doctor_app': 'releez.subapps.doctor',
+    'projects_app': 'releez.subapps.projects',
+    'release_app': 'releez.subapps.release',
+    'validate_app': 'releez.subapps.validate',
+    'version_app': 'releez.subapps.version',
+}
+
+
+def __getattr__(name: str) -> object:
+    """Lazily resolve sub-app re-exports.
+
+    Importing any single subapp module also imports this package __init__;
+    eager re-exports here would drag in every sibling subapp and defeat the
+    lazy command registration in releez.cli.
+    """
+    module_path = _APP_MODULES.get(name)
+    if module_path is not None:
+        return getattr(import_module(module_path), name)
+    msg = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(msg)
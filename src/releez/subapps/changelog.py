@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 from releez.cliff import GitCliff
 from releez.console import console
 from releez.git_repo import open_repo
-from releez.settings import ReleezSettings
+from releez.settings import get_settings
 from releez.utils import (
     handle_releez_errors,
     resolve_changelog_path,
@@ -23,23 +23,22 @@ changelog_app = App(name='changelog', help='Changelog utilities.')
 
 def _run_single_repo_regenerate(
     *,
+    cliff: GitCliff,
     changelog_path: str,
     repo_root: Path,
 ) -> None:
     """Run changelog regeneration in single-repo mode."""
     changelog = resolve_changelog_path(changelog_path, repo_root)
-    cliff = GitCliff(repo_root=repo_root)
     cliff.regenerate_changelog(changelog_path=changelog)
     console.print(f'✓ Regenerated changelog: {changelog}', style='green')
 
 
 def _run_project_regenerate(
     *,
+    cliff: GitCliff,
     project: SubProject,
-    repo_root: Path,
 ) -> None:
     """Regenerate changelog for a single project."""
-    cliff = GitCliff(repo_root=repo_root)
     cliff.regenerate_changelog(
         changelog_path=project.changelog_path,
         tag_pattern=project.tag_pattern,
@@ -84,7 +83,7 @@ def regenerate(
     ] = False,
 ) -> None:
     """Regenerate the full changelog from git history."""
-    settings = ReleezSettings()
+    settings = get_settings()
     settings.validate_project_flags(
         project_names=project_names,
         all_projects=all_projects,
@@ -96,8 +95,10 @@ def regenerate(
     # Apply config-backed default for changelog_path
     resolved_changelog_path: str = changelog_path if changelog_path is not None else settings.changelog_path
 
+    cliff = GitCliff(repo_root=repo_root)
     if not settings.is_monorepo:
         _run_single_repo_regenerate(
+            cliff=cliff,
             changelog_path=resolved_changelog_path,
             repo_root=repo_root,
         )
@@ -110,6 +111,6 @@ def regenerate(
     )
     for project in resolved:
         _run_project_regenerate(
+            cliff=cliff,
             project=project,
-            repo_root=repo_root,
         )
@@ -12,7 +12,7 @@ from releez.cliff import MissingCliError, _git_cliff_base_cmd
 from releez.console import console, err_console
 from releez.errors import ReleezError
 from releez.git_repo import open_repo
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, get_settings
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -235,7 +235,7 @@ def run_checks() -> None:
     settings: ReleezSettings | None = None
     if ctx is not None:
         try:
-            settings = ReleezSettings()
+            settings = get_settings()
         except Exception as exc:  # noqa: BLE001
             checks.append(
                 _Check(message=f'failed to load settings: {exc}', passed=False),
@@ -8,7 +8,7 @@ from cyclopts import App, Parameter
 
 from releez.console import console, err_console
 from releez.git_repo import detect_changed_projects, open_repo
-from releez.settings import ReleezSettings
+from releez.settings import get_settings
 from releez.subproject import SubProject  # noqa: TC001
 from releez.utils import handle_releez_errors
 
@@ -40,7 +40,7 @@ def _output_changed_projects(
 @projects_app.command
 def list() -> None:  # noqa: A001
     """List configured monorepo projects."""
-    settings = ReleezSettings()
+    settings = get_settings()
 
     if not settings.projects:
         console.print(
@@ -94,7 +94,7 @@ def changed(
     ] = None,
 ) -> None:
     """Detect projects that have unreleased changes."""
-    settings = ReleezSettings()
+    settings = get_settings()
 
     if not settings.projects:
         err_console.print(
@@ -121,7 +121,7 @@ def info(
     name: Annotated[str, Parameter(help='Project name.')],
 ) -> None:
     """Show configuration details for one project."""
-    settings = ReleezSettings()
+    settings = get_settings()
 
     if not settings.projects:
         err_console.print(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
@@ -151,14 +153,6 @@ def _resolve_project_release_version(
     )
 
 
-def _project_semver_version(
-    *,
-    project: SubProject,  # noqa: ARG001
-    version: VersionInfo,
-) -> str:
-    return str(version)
-
-
 def _alias_versions_for_project(
     *,
     cli_alias_versions: AliasVersions | None,
@@ -179,6 +173,12 @@ def _emit_or_write_output(
     content: str,
 ) -> None:
     if output is None:
+        stdout = sys.stdout
+        if not stdout.isatty():
+            # Piped/CI output: skip rich's console construction and
+            # wrapping layer and emit the content verbatim.
+            stdout.write(content + '\n')
+            return
         console.print(content, markup=False)
         return
     output_path = Path(output)
@@ -307,9 +307,9 @@ class ReleaseStartOptions(BaseModel):
             },
         )
 
-    @property
+    @cached_property
     def labels_list(self) -> list[str]:
-        """Split comma-separated labels string into a list."""
+        """Split comma-separated labels string into a list (computed once)."""
         labels = self.labels or ''
         return labels.split(',') if labels else []
 
@@ -408,3 +408,18 @@ class ReleaseNotesOptions(BaseModel):
             show_default=False,
         ),
     ] = None
+
+
+# ---------------------------------------------------------------------------
+# Command registration
+# ---------------------------------------------------------------------------
+# Importing this module must yield a fully populated release_app, including
+# when it is loaded lazily from releez.cli. The command modules import back
+# from this module, so they are imported last (after everything they need
+# is defined).
+
+import releez.subapps.release_notes  # noqa: E402
+import releez.subapps.release_preview  # noqa: E402
+import releez.subapps.release_start  # noqa: E402
+import releez.subapps.release_support  # noqa: E402
+import releez.subapps.release_tag  # noqa: E402, F401 — triggers command registration on release_app
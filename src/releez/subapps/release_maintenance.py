@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from releez.errors import (
@@ -15,7 +16,7 @@ if TYPE_CHECKING:
     from releez.subproject import SubProject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaintenanceContext:
     """Detected maintenance branch context.
 
@@ -39,23 +40,36 @@ class MaintenanceContext:
             )
 
 
-def _maintenance_major(*, branch: str, regex: str) -> int | None:
-    """Extract the major version integer from a branch name via regex.
+@lru_cache(maxsize=32)
+def _compile_maintenance_regex(regex: str) -> re.Pattern[str]:
+    """Compile a maintenance branch regex, caching compiled patterns.
 
-    Returns the major version if the branch matches, or None if no match.
+    The same regex is compiled for every release command within a process;
+    the cache makes repeated lookups reuse the compiled pattern.
 
     Raises:
-        InvalidMaintenanceBranchRegexError: If the regex is invalid, missing
-            the 'major' named capture group, or captures a non-integer value.
+        InvalidMaintenanceBranchRegexError: If the regex is invalid.
     """
     try:
-        pattern = re.compile(regex)
+        return re.compile(regex)
     except re.error as exc:
         raise InvalidMaintenanceBranchRegexError(
             pattern=regex,
             reason=str(exc),
         ) from exc
 
+
+def _maintenance_major(*, branch: str, regex: str) -> int | None:
+    """Extract the major version integer from a branch name via regex.
+
+    Returns the major version if the branch matches, or None if no match.
+
+    Raises:
+        InvalidMaintenanceBranchRegexError: If the regex is invalid, missing
+            the 'major' named capture group, or captures a non-integer value.
+    """
+    pattern = _compile_maintenance_regex(regex)
+
     if 'major' not in pattern.groupindex:
         raise InvalidMaintenanceBranchRegexError(
             pattern=regex,
@@ -67,20 +81,17 @@ def _maintenance_major(*, branch: str, regex: str) -> int | None:
         return None
 
     major_str = match.group('major')
-    try:
-        return int(major_str)
-    except ValueError as exc:
+    # isascii() matters: isdigit() accepts non-ASCII digit characters
+    # (e.g. '²') that int() cannot parse.
+    if not (major_str.isascii() and major_str.isdigit()):
         raise InvalidMaintenanceBranchRegexError(
             pattern=regex,
             reason=f'invalid major value {major_str!r}: must be an integer',
-        ) from exc
-
-
-def _maintenance_tag_pattern(major: int) -> str:
-    """Return a git-cliff tag pattern scoped to a given major version."""
-    return f'^{major}\\.[0-9]+\\.[0-9]+$'
+        )
+    return int(major_str)
 
 
+@lru_cache(maxsize=64)
 def _maintenance_context(
     *,
     branch: str | None,
@@ -89,6 +100,9 @@ def _maintenance_context(
     """Detect and build a maintenance context from the current branch name.
 
     Returns None if branch is None or does not match the maintenance regex.
+    Results are cached per (branch, regex); the major extraction and the
+    derived tag pattern are computed together in this one cached call, and
+    the frozen context can be shared safely across commands in one process.
     """
     if branch is None:
         return None
@@ -98,7 +112,7 @@ def _maintenance_context(
     return MaintenanceContext(
         branch=branch,
         major=major,
-        tag_pattern=_maintenance_tag_pattern(major),
+        tag_pattern=f'^{major}\\.[0-9]+\\.[0-9]+$',
     )
 
 
@@ -107,6 +121,12 @@ def _monorepo_maintenance_tag_pattern(prefix: str, major: int) -> str:
     return f'^{re.escape(prefix)}{major}\\.[0-9]+\\.[0-9]+$'
 
 
+@lru_cache(maxsize=64)
+def _project_support_branch_pattern(tag_prefix: str) -> re.Pattern[str]:
+    r"""Compiled fallback pattern for ``support/{tag_prefix}<major>.x`` branches."""
+    return re.compile(rf'^support/{re.escape(tag_prefix)}(?P<major>\d+)\.x$')
+
+
 def _monorepo_context_from_prefix_regex(
     branch: str,
     projects: list[SubProject],
@@ -153,16 +173,19 @@ def _monorepo_maintenance_context(
     if branch is None:
         return None
     try:
-        compiled = re.compile(regex)
-    except re.error:
+        compiled = _compile_maintenance_regex(regex)
+    except InvalidMaintenanceBranchRegexError:
         return None
     if 'prefix' in compiled.groupindex:
         return _monorepo_context_from_prefix_regex(branch, projects, compiled)
+    if not branch.startswith('support/'):
+        # The per-project fallback patterns all anchor on 'support/'; no
+        # project can match, so skip the per-project regex loop entirely.
+        return None
     for project in projects:
         if not project.tag_prefix:
             continue
-        pattern = rf'^support/{re.escape(project.tag_prefix)}(?P<major>\d+)\.x$'
-        match = re.match(pattern, branch)
+        match = _project_support_branch_pattern(project.tag_prefix).match(branch)
         if match:
             major = int(match.group('major'))
             ctx = MaintenanceContext(
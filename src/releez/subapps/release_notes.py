@@ -7,12 +7,11 @@ from cyclopts import Parameter
 
 from releez.cli_utils import _project_include_paths, _resolve_release_version
 from releez.cliff import GitCliff
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, get_settings
 from releez.subapps.release import (
     ProjectSelection,
     ReleaseNotesOptions,
     _emit_or_write_output,
-    _project_semver_version,
     _require_single_project_override_scope,
     _resolve_project_release_version,
     _resolve_project_targets_for_command,
@@ -23,24 +22,21 @@ from releez.utils import handle_releez_errors
 from releez.version_tags import compute_version_tags
 
 if TYPE_CHECKING:
+    from semver import VersionInfo
+
     from releez.subproject import SubProject
 
 
 def _generate_release_notes_single_repo(
     *,
     cliff: GitCliff,
-    repo_root: Path,
-    version_override: str | None,
+    version: VersionInfo,
     tag_pattern: str | None = None,
 ) -> str:
-    version = _resolve_release_version(
-        repo_root=repo_root,
-        version_override=version_override,
-        tag_pattern=tag_pattern,
-    )
-    compute_version_tags(version=str(version))
+    version_str = str(version)
+    compute_version_tags(version=version)
     return cliff.generate_unreleased_notes(
-        version=str(version),
+        version=version_str,
         tag_pattern=tag_pattern,
     )
 
@@ -59,12 +55,8 @@ def _generate_release_notes_monorepo(
             version_override=version_override,
             project=project,
         )
-        semver_version = _project_semver_version(
-            project=project,
-            version=version,
-        )
         compute_version_tags(
-            version=semver_version,
+            version=version,
             tag_prefix=project.tag_prefix,
         )
         project_notes = cliff.generate_unreleased_notes(
@@ -103,18 +95,19 @@ def _run_release_notes_command(
     )
     cliff = GitCliff(repo_root=resolved.repo_root)
     if resolved.target_projects is None:
+        # Resolve the version once (git-cliff is an external process) and
+        # reuse it for both maintenance validation and the notes section.
         tag_pattern = maintenance_ctx.tag_pattern if maintenance_ctx else None
+        version = _resolve_release_version(
+            repo_root=resolved.repo_root,
+            version_override=options.version_override,
+            tag_pattern=tag_pattern,
+        )
         if maintenance_ctx:
-            version = _resolve_release_version(
-                repo_root=resolved.repo_root,
-                version_override=options.version_override,
-                tag_pattern=tag_pattern,
-            )
             maintenance_ctx.ensure_version_matches(version)
         notes = _generate_release_notes_single_repo(
             cliff=cliff,
-            repo_root=resolved.repo_root,
-            version_override=options.version_override,
+            version=version,
             tag_pattern=tag_pattern,
         )
     else:
@@ -139,7 +132,7 @@ def notes(
         options = ReleaseNotesOptions()
     if selection is None:
         selection = ProjectSelection()
-    settings = ReleezSettings()
+    settings = get_settings()
     _run_release_notes_command(
         settings=settings,
         options=options,
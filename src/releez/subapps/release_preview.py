@@ -6,13 +6,12 @@ from typing import TYPE_CHECKING, Annotated
 from cyclopts import Parameter
 
 from releez.cli_utils import _resolve_release_version
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, get_settings
 from releez.subapps.release import (
     ProjectSelection,
     ReleasePreviewOptions,
     _alias_versions_for_project,
     _emit_or_write_output,
-    _project_semver_version,
     _require_single_project_override_scope,
     _resolve_project_release_version,
     _resolve_project_targets_for_command,
@@ -23,6 +22,8 @@ from releez.utils import handle_releez_errors
 from releez.version_tags import AliasVersions, compute_version_tags, select_tags
 
 if TYPE_CHECKING:
+    from semver import VersionInfo
+
     from releez.subproject import SubProject
 
 
@@ -45,24 +46,20 @@ def _render_preview_section(
 def _build_release_preview_markdown_single_repo(
     *,
     options: ReleasePreviewOptions,
-    repo_root: Path,
-    tag_pattern: str | None = None,
+    version: VersionInfo,
 ) -> str:
-    version = _resolve_release_version(
-        repo_root=repo_root,
-        version_override=options.version_override,
-        tag_pattern=tag_pattern,
-    )
     version_str = str(version)
     tags = select_tags(
-        tags=compute_version_tags(version=version_str),
+        tags=compute_version_tags(version=version),
         aliases=options.alias_versions or AliasVersions.none,
     )
-    lines = ['## `releez` release preview', '']
-    lines.extend(
-        _render_preview_section(title=None, version=version_str, tags=tags),
+    return '\n'.join(
+        [
+            '## `releez` release preview',
+            '',
+            *_render_preview_section(title=None, version=version_str, tags=tags),
+        ],
     )
-    return '\n'.join(lines)
 
 
 def _build_release_preview_markdown_monorepo(
@@ -78,13 +75,9 @@ def _build_release_preview_markdown_monorepo(
             version_override=options.version_override,
             project=project,
         )
-        semver_version = _project_semver_version(
-            project=project,
-            version=version,
-        )
         tags = select_tags(
             tags=compute_version_tags(
-                version=semver_version,
+                version=version,
                 tag_prefix=project.tag_prefix,
             ),
             aliases=_alias_versions_for_project(
@@ -126,18 +119,19 @@ def _run_release_preview_command(
         regex=settings.effective_maintenance_branch_regex,
     )
     if resolved.target_projects is None:
+        # Resolve the version once (git-cliff is an external process) and
+        # reuse it for both maintenance validation and the preview itself.
         tag_pattern = maintenance_ctx.tag_pattern if maintenance_ctx else None
+        version = _resolve_release_version(
+            repo_root=resolved.repo_root,
+            version_override=options.version_override,
+            tag_pattern=tag_pattern,
+        )
         if maintenance_ctx:
-            version = _resolve_release_version(
-                repo_root=resolved.repo_root,
-                version_override=options.version_override,
-                tag_pattern=tag_pattern,
-            )
             maintenance_ctx.ensure_version_matches(version)
         markdown = _build_release_preview_markdown_single_repo(
             options=resolved_options,
-            repo_root=resolved.repo_root,
-            tag_pattern=tag_pattern,
+            version=version,
         )
     else:
         markdown = _build_release_preview_markdown_monorepo(
@@ -160,7 +154,7 @@ def preview(
         options = ReleasePreviewOptions()
     if selection is None:
         selection = ProjectSelection()
-    settings = ReleezSettings()
+    settings = get_settings()
     _run_release_preview_command(
         settings=settings,
         options=options,
@@ -14,7 +14,7 @@ from releez.cli_utils import (
 from releez.console import console, err_console
 from releez.errors import ReleezError
 from releez.release import StartReleaseInput, StartReleaseResult, start_release
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, get_settings
 from releez.subapps.release import (
     ProjectSelection,
     ReleaseStartOptions,
@@ -359,7 +359,7 @@ def start(
     ] = False,
 ) -> None:
     """Start release branch workflows for single-repo or monorepo projects."""
-    settings = ReleezSettings()
+    settings = get_settings()
     options = options.resolve(settings)
     effective_regex = maintenance_branch_regex or settings.effective_maintenance_branch_regex
 
@@ -23,7 +23,7 @@ from releez.git_repo import (
     open_repo,
     validate_commit_for_major,
 )
-from releez.settings import ReleezSettings
+from releez.settings import get_settings
 from releez.subapps.release import _project_names_csv, release_app
 from releez.subapps.release_maintenance import (
     _maintenance_major,
@@ -259,7 +259,7 @@ def detect_from_branch(
     Single repo format: release/1.2.3
     Monorepo format: release/core-1.2.3
     """
-    settings = ReleezSettings()
+    settings = get_settings()
     branch_name = _get_branch_name(branch)
     info = open_repo().info
     subprojects = settings.get_subprojects(repo_root=info.root)
@@ -330,7 +330,7 @@ def support_branch(
         releez release support-branch 1 --project ui
         → creates support/ui-1.x from ui-1.4.0
     """
-    settings = ReleezSettings()
+    settings = get_settings()
     ctx_repo = open_repo()
     repo = ctx_repo.repo
     subprojects = settings.get_subprojects(repo_root=ctx_repo.info.root)
@@ -8,12 +8,11 @@ from cyclopts import Parameter
 from releez.cli_utils import _resolve_release_version
 from releez.console import console
 from releez.git_repo import create_tags, fetch, push_tags
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, get_settings
 from releez.subapps.release import (
     ProjectSelection,
     ReleaseTagOptions,
     _alias_versions_for_project,
-    _project_semver_version,
     _require_single_project_override_scope,
     _resolve_project_release_version,
     _resolve_project_targets_for_command,
@@ -62,7 +61,7 @@ def _selected_tags_for_single_repo(
         version_override=options.version_override,
         tag_pattern=tag_pattern,
     )
-    tags = compute_version_tags(version=str(version))
+    tags = compute_version_tags(version=version)
     return select_tags(
         tags=tags,
         aliases=options.alias_versions or AliasVersions.none,
@@ -80,9 +79,8 @@ def _selected_tags_for_project(
         version_override=options.version_override,
         project=project,
     )
-    semver_version = _project_semver_version(project=project, version=version)
     tags = compute_version_tags(
-        version=semver_version,
+        version=version,
         tag_prefix=project.tag_prefix,
     )
     aliases = _alias_versions_for_project(
@@ -171,7 +169,7 @@ def tag(
         options = ReleaseTagOptions()
     if selection is None:
         selection = ProjectSelection()
-    settings = ReleezSettings()
+    settings = get_settings()
     _run_release_tag_command(
         settings=settings,
         options=options,
@@ -19,7 +19,7 @@ from releez.cli_utils import (
 )
 from releez.console import console, err_console
 from releez.git_repo import open_repo
-from releez.settings import ReleezSettings
+from releez.settings import ReleezSettings, get_settings
 from releez.utils import handle_releez_errors
 from releez.version_tags import AliasVersions, compute_version_tags, select_tags
 
@@ -240,7 +240,7 @@ def artifact(  # noqa: PLR0913
     """Compute an artifact version string."""
     if prerelease is None:
         prerelease = PrereleaseOptions()
-    settings = ReleezSettings()
+    settings = get_settings()
     resolved_alias_versions = alias_versions if alias_versions is not None else settings.alias_versions
     resolved_tag_prefix, resolved_version_override = _resolve_artifact_project_context(
         settings=settings,
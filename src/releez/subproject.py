@@ -17,7 +17,7 @@ class MonorepoValidationError(ReleezError):
     """Error raised when monorepo configuration is invalid."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubProject:
     """Represents a subproject in a monorepo.
 
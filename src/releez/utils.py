@@ -65,6 +65,7 @@ def run_post_changelog_hooks(
         ExternalCommandError: If any hook command fails.
     """
     for hook_cmd in hooks:
-        # Substitute template variables in each argument
-        cmd = [arg.format(**template_vars) if '{' in arg else arg for arg in hook_cmd]
+        # Substitute template variables in each argument; args without a
+        # placeholder are passed through without allocating a new string.
+        cmd = [arg.format_map(template_vars) if '{' in arg else arg for arg in hook_cmd]
         run_checked(cmd, cwd=repo_root, capture_stdout=False)
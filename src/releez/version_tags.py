@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 
 from semver import VersionInfo
 
@@ -16,7 +17,7 @@ class AliasVersions(StrEnum):
     minor = 'minor'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionTags:
     """Computed tags for a release version.
 
@@ -31,11 +32,81 @@ class VersionTags:
     minor: str
 
 
-def compute_version_tags(*, version: str, tag_prefix: str = '') -> VersionTags:
+def _split_simple_version(value: str) -> tuple[str, str, str] | None:
+    """Split a plain ``x.y.z`` version into its string components.
+
+    Returns None for anything else (prerelease, build metadata, leading
+    zeros, ...), which callers should hand to ``VersionInfo.parse`` so the
+    semver grammar stays the single source of truth for edge cases.
+    """
+    parts = value.split('.')
+    if len(parts) != 3:
+        return None
+    for part in parts:
+        # isascii() matters: isdigit() accepts non-ASCII digits (e.g. '١'),
+        # which the semver grammar rejects and int() may not even parse.
+        if not (part.isascii() and part.isdigit()) or (len(part) > 1 and part[0] == '0'):
+            return None
+    return (parts[0], parts[1], parts[2])
+
+
+def _parse_simple_version(value: str) -> VersionInfo | None:
+    """Parse a plain ``x.y.z`` version without the full semver regex."""
+    parts = _split_simple_version(value)
+    if parts is None:
+        return None
+    return VersionInfo(int(parts[0]), int(parts[1]), int(parts[2]))
+
+
+@lru_cache(maxsize=128)
+def _compute_version_tags(
+    version: str | VersionInfo,
+    tag_prefix: str,
+) -> VersionTags:
+    """Compute version tags; cached since both inputs and result are immutable."""
+    if isinstance(version, VersionInfo):
+        if version.prerelease is not None or version.build is not None:
+            raise InvalidReleaseVersionError(str(version))
+        return VersionTags(
+            exact=f'{tag_prefix}{version}',
+            major=f'{tag_prefix}v{version.major}',
+            minor=f'{tag_prefix}v{version.major}.{version.minor}',
+        )
+
+    normalized = version.strip().removeprefix('v')
+    simple = _split_simple_version(normalized)
+    if simple is None:
+        # Not a plain x.y.z; let the semver grammar decide whether it is
+        # malformed or a (rejected) prerelease/build version.
+        try:
+            VersionInfo.parse(normalized)
+        except ValueError as exc:
+            raise InvalidReleaseVersionError(version) from exc
+        # Parsed fine but was not plain x.y.z: prerelease/build versions
+        # are not releasable.
+        raise InvalidReleaseVersionError(str(version))
+
+    major, minor, _ = simple
+    return VersionTags(
+        exact=f'{tag_prefix}{normalized}',
+        major=f'{tag_prefix}v{major}',
+        minor=f'{tag_prefix}v{major}.{minor}',
+    )
+
+
+def compute_version_tags(
+    *,
+    version: str | VersionInfo,
+    tag_prefix: str = '',
+) -> VersionTags:
     """Compute exact/major/minor tags for a full release version.
 
+    Results are memoized per (version, tag_prefix) — release commands derive
+    the same tags several times per invocation (preview, validation, push).
+
     Args:
-        version: The full release version (`x.y.z`).
+        version: The full release version (`x.y.z`), either as a string or an
+            already-parsed VersionInfo (skips re-parsing).
         tag_prefix: Optional prefix for tags (e.g., "core-" creates "core-1.2.3").
 
     Returns:
@@ -50,27 +121,16 @@ def compute_version_tags(*, version: str, tag_prefix: str = '') -> VersionTags:
         >>> compute_version_tags(version='1.2.3', tag_prefix='core-')
         VersionTags(exact='core-1.2.3', major='core-v1', minor='core-v1.2')
     """
-    normalized = version.strip().removeprefix('v')
-
-    try:
-        parsed = VersionInfo.parse(normalized)
-    except ValueError as exc:
-        raise InvalidReleaseVersionError(version) from exc
+    return _compute_version_tags(version, tag_prefix)
 
-    if parsed.prerelease is not None or parsed.build is not None:
-        raise InvalidReleaseVersionError(version)
 
-    return VersionTags(
-        exact=f'{tag_prefix}{normalized}',
-        major=f'{tag_prefix}v{parsed.major}',
-        minor=f'{tag_prefix}v{parsed.major}.{parsed.minor}',
-    )
+_ALIAS_TAG_COUNT = {
+    AliasVersions.none: 1,
+    AliasVersions.major: 2,
+    AliasVersions.minor: 3,
+}
 
 
 def select_tags(*, tags: VersionTags, aliases: AliasVersions) -> list[str]:
     """Select which version aliases to output/publish given an alias level."""
-    if aliases == AliasVersions.none:
-        return [tags.exact]
-    if aliases == AliasVersions.major:
-        return [tags.exact, tags.major]
-    return [tags.exact, tags.major, tags.minor]
+    return [tags.exact, tags.major, tags.minor][: _ALIAS_TAG_COUNT[aliases]]
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+
+class CliffPatcher(Protocol):
+    """Protocol for the patched_cliff fixture callable."""
+
+    def __call__(self, version: str, *, notes: str | None = None) -> Mock: ...
+
+
+class ReleaseRepoPatcher(Protocol):
+    """Protocol for the patched_release_repo fixture callable."""
+
+    def __call__(self, active_branch: str) -> Mock: ...
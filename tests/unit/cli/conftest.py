@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Repo
+
+from releez.git_repo import RepoInfo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import Mock
+
+    from cli_fixtures import CliffPatcher, ReleaseRepoPatcher
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def patched_release_repo(
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> ReleaseRepoPatcher:
+    """Patch releez.subapps.release.open_repo with a stub repo context.
+
+    Returns a callable taking the active branch name. Calling it patches
+    open_repo to return a RepoContext-shaped mock rooted at tmp_path and
+    returns that mock for further assertions.
+    """
+
+    def _patch(active_branch: str) -> Mock:
+        info = RepoInfo(
+            root=tmp_path,
+            remote_url='',
+            active_branch=active_branch,
+        )
+        ctx = mocker.Mock(repo=mocker.Mock(spec=Repo), info=info)
+        mocker.patch('releez.subapps.release.open_repo', return_value=ctx)
+        return ctx
+
+    return _patch
+
+
+@pytest.fixture
+def patched_cliff(mocker: MockerFixture) -> CliffPatcher:
+    """Patch releez.cli_utils.GitCliff with a stub returning a fixed version.
+
+    Returns a callable taking the next version (and optionally unreleased
+    notes); it patches GitCliff and returns the cliff mock for assertions.
+    """
+
+    def _patch(version: str, *, notes: str | None = None) -> Mock:
+        cliff = mocker.Mock()
+        cliff.compute_next_version.return_value = version
+        if notes is not None:
+            cliff.generate_unreleased_notes.return_value = notes
+        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        return cliff
+
+    return _patch
@@ -51,19 +51,13 @@ def mock_changelog_setup(
         repo_root = tmp_path / 'repo'
         repo_root.mkdir()
 
-        if changelog_paths is None:
-            changelog_file = repo_root / 'CHANGELOG.md'
+        for path_str in changelog_paths if changelog_paths is not None else ['CHANGELOG.md']:
+            changelog_file = Path(path_str)
+            if not changelog_file.is_absolute():
+                changelog_file = repo_root / path_str
+            if changelog_file.parent != repo_root:
+                changelog_file.parent.mkdir(parents=True, exist_ok=True)
             changelog_file.write_text('# Changelog\n')
-        else:
-            for path_str in changelog_paths:
-                changelog_path = Path(path_str)
-                if changelog_path.is_absolute():
-                    changelog_path.parent.mkdir(parents=True, exist_ok=True)
-                    changelog_path.write_text('# Changelog\n')
-                else:
-                    changelog_file = repo_root / path_str
-                    changelog_file.parent.mkdir(parents=True, exist_ok=True)
-                    changelog_file.write_text('# Changelog\n')
 
         mocker.patch(
             'releez.subapps.changelog.open_repo',
@@ -32,7 +32,7 @@ def _mock_settings(  # noqa: PLR0913
         is_monorepo=is_monorepo,
         projects=projects or [],
     )
-    mocker.patch('releez.subapps.doctor.ReleezSettings', return_value=mock)
+    mocker.patch('releez.subapps.doctor.get_settings', return_value=mock)
     return mock
 
 
@@ -154,7 +154,7 @@ class TestDoctorGitChecks:
             side_effect=Exception('no git'),
         )
         mocker.patch(
-            'releez.subapps.doctor.ReleezSettings',
+            'releez.subapps.doctor.get_settings',
             side_effect=Exception('no settings'),
         )
 
@@ -181,7 +181,7 @@ class TestDoctorGitChecks:
             side_effect=Exception('no repo'),
         )
         mocker.patch(
-            'releez.subapps.doctor.ReleezSettings',
+            'releez.subapps.doctor.get_settings',
             side_effect=Exception('no settings'),
         )
 
@@ -210,7 +210,7 @@ class TestDoctorRepoCheck:
             side_effect=Exception('not a repo'),
         )
         mocker.patch(
-            'releez.subapps.doctor.ReleezSettings',
+            'releez.subapps.doctor.get_settings',
             side_effect=Exception('no settings'),
         )
 
@@ -236,7 +236,7 @@ class TestDoctorRepoCheck:
         _write_cliff_toml(tmp_path)
         _mock_repo(mocker, root=tmp_path)
         mocker.patch(
-            'releez.subapps.doctor.ReleezSettings',
+            'releez.subapps.doctor.get_settings',
             side_effect=Exception('bad config'),
         )
 
@@ -262,7 +262,7 @@ class TestDoctorRepoCheck:
         _write_cliff_toml(tmp_path)
         _mock_repo(mocker, root=tmp_path, is_dirty=True)
         mocker.patch(
-            'releez.subapps.doctor.ReleezSettings',
+            'releez.subapps.doctor.get_settings',
             side_effect=Exception('bad config'),
         )
 
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def _run_in_fresh_interpreter(code: str) -> None:
+    """Run a snippet in a clean interpreter so sys.modules starts empty."""
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_help_imports_no_subapp_modules() -> None:
+    """`releez --help` must not import any subapp module (or their heavy deps)."""
+    _run_in_fresh_interpreter(
+        'import sys\n'
+        'from releez.cli import app\n'
+        'try:\n'
+        "    app(['--help'])\n"
+        'except SystemExit:\n'
+        '    pass\n'
+        "loaded = [m for m in sys.modules if m.startswith('releez.subapps')]\n"
+        'assert not loaded, loaded\n'
+        "heavy = [m for m in ('git', 'pydantic', 'semver') if m in sys.modules]\n"
+        'assert not heavy, heavy\n',
+    )
+
+
+def test_dispatch_does_not_import_sibling_subapps() -> None:
+    """Dispatching one subcommand must not import the other subapp modules."""
+    _run_in_fresh_interpreter(
+        'import sys\n'
+        'from releez.cli import app\n'
+        'try:\n'
+        "    app(['version', '--help'])\n"
+        'except SystemExit:\n'
+        '    pass\n'
+        "assert 'releez.subapps.version' in sys.modules\n"
+        'unwanted = [\n'
+        '    m\n'
+        '    for m in sys.modules\n'
+        "    if m.startswith(('releez.subapps.release', 'releez.subapps.doctor'))\n"
+        ']\n'
+        'assert not unwanted, unwanted\n',
+    )
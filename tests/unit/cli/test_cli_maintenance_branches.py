@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pytest
-from git import Repo
 from invoke_helper import invoke
 from semver import VersionInfo
 
@@ -13,7 +12,6 @@ from releez.errors import (
     MaintenanceBranchMajorMismatchError,
     ReleezError,
 )
-from releez.git_repo import RepoInfo
 from releez.subapps import release
 from releez.subapps.release_maintenance import (
     MaintenanceContext,
@@ -30,8 +28,14 @@ if TYPE_CHECKING:
     from pathlib import Path
     from unittest.mock import MagicMock
 
+    from cli_fixtures import CliffPatcher, ReleaseRepoPatcher
     from pytest_mock import MockerFixture
 
+# The default single-repo maintenance branch regex, shared across tests.
+# releez compiles patterns through an lru_cache, so reusing one literal also
+# means one compile for the whole module.
+_SUPPORT_BRANCH_REGEX = r'^support/(?P<major>\d+)\.x$'
+
 
 class TestMaintenanceMajor:
     """Tests for _maintenance_major function."""
@@ -66,6 +70,15 @@ class TestMaintenanceMajor:
         assert error.pattern == r'^support/(?P<major>\w+)\.x$'
         assert "invalid major value 'abc'" in str(error)
 
+    def test_non_ascii_digit_major_value_raises_error(self) -> None:
+        with pytest.raises(InvalidMaintenanceBranchRegexError) as exc_info:
+            _maintenance_major(
+                branch='support/².x',
+                regex=r'^support/(?P<major>\w+)\.x$',
+            )
+
+        assert "invalid major value '²'" in str(exc_info.value)
+
 
 class TestValidateMaintenanceVersion:
     """Tests for _validate_maintenance_version function."""
@@ -156,25 +169,13 @@ class TestReleaseStartConfirmInteractive:
     def test_release_start_on_maintenance_branch_prompts_when_not_dry_run(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
         """Test that confirmation prompt is shown when non_interactive=False and not dry_run."""
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/1.x')
 
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '1.5.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        patched_cliff('1.5.0')
 
         mocker.patch(
             'releez.subapps.release_start.start_release',
@@ -196,7 +197,7 @@ class TestReleaseStartConfirmInteractive:
                 'release',
                 'start',
                 '--maintenance-branch-regex',
-                r'^support/(?P<major>\d+)\.x$',
+                _SUPPORT_BRANCH_REGEX,
             ],
         )
 
@@ -210,24 +211,12 @@ class TestReleaseStartOnMaintenanceBranch:
     def test_release_start_on_maintenance_branch_uses_tag_pattern(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/1.x')
 
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '1.5.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        patched_cliff('1.5.0')
 
         start_release = mocker.patch(
             'releez.subapps.release_start.start_release',
@@ -246,7 +235,7 @@ class TestReleaseStartOnMaintenanceBranch:
                 'start',
                 '--dry-run',
                 '--maintenance-branch-regex',
-                r'^support/(?P<major>\d+)\.x$',
+                _SUPPORT_BRANCH_REGEX,
             ],
         )
 
@@ -257,24 +246,12 @@ class TestReleaseStartOnMaintenanceBranch:
     def test_release_start_on_maintenance_branch_sets_base_to_current(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/2.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/2.x')
 
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.1.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        patched_cliff('2.1.0')
 
         start_release = mocker.patch(
             'releez.subapps.release_start.start_release',
@@ -295,7 +272,7 @@ class TestReleaseStartOnMaintenanceBranch:
                 '--base',
                 'master',
                 '--maintenance-branch-regex',
-                r'^support/(?P<major>\d+)\.x$',
+                _SUPPORT_BRANCH_REGEX,
             ],
         )
 
@@ -306,20 +283,9 @@ class TestReleaseStartOnMaintenanceBranch:
     def test_release_start_on_non_maintenance_branch_uses_base(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='feature/my-feature',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('feature/my-feature')
 
         start_release = mocker.patch(
             'releez.subapps.release_start.start_release',
@@ -340,7 +306,7 @@ class TestReleaseStartOnMaintenanceBranch:
                 '--base',
                 'master',
                 '--maintenance-branch-regex',
-                r'^support/(?P<major>\d+)\.x$',
+                _SUPPORT_BRANCH_REGEX,
             ],
         )
 
@@ -349,42 +315,6 @@ class TestReleaseStartOnMaintenanceBranch:
         assert release_input.base_branch == 'master'
         assert release_input.maintenance_tag_pattern is None
 
-    def test_release_start_on_maintenance_branch_version_mismatch_fails(
-        self,
-        mocker: MockerFixture,
-        tmp_path: Path,
-    ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
-
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.0.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
-
-        result = invoke(
-            cli.app,
-            [
-                'release',
-                'start',
-                '--dry-run',
-                '--maintenance-branch-regex',
-                r'^support/(?P<major>\d+)\.x$',
-            ],
-        )
-
-        assert result.exit_code == 1
-        assert 'does not match maintenance branch' in result.output
-
 
 class TestReleaseTagOnMaintenanceBranch:
     """Tests for release tag command on maintenance branch."""
@@ -392,23 +322,13 @@ class TestReleaseTagOnMaintenanceBranch:
     def test_release_tag_on_maintenance_branch_uses_tag_pattern(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo = mocker.Mock(spec=Repo)
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(repo=repo, info=repo_info),
-        )
+        patched_release_repo('support/1.x')
         mocker.patch('releez.subapps.release_tag.fetch')
 
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '1.5.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        cliff = patched_cliff('1.5.0')
 
         mocker.patch('releez.subapps.release_tag.compute_version_tags')
         mocker.patch(
@@ -427,38 +347,6 @@ class TestReleaseTagOnMaintenanceBranch:
             include_paths=None,
         )
 
-    def test_release_tag_on_maintenance_branch_version_mismatch_fails(
-        self,
-        mocker: MockerFixture,
-        tmp_path: Path,
-    ) -> None:
-        repo = mocker.Mock(spec=Repo)
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(repo=repo, info=repo_info),
-        )
-        mocker.patch('releez.subapps.release_tag.fetch')
-
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.0.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
-
-        mocker.patch('releez.subapps.release_tag.compute_version_tags')
-        mocker.patch(
-            'releez.subapps.release_tag.select_tags',
-            return_value=['2.0.0'],
-        )
-
-        result = invoke(cli.app, ['release', 'tag'])
-
-        assert result.exit_code == 1
-        assert 'does not match maintenance branch' in result.output
-
 
 class TestReleasePreviewOnMaintenanceBranch:
     """Tests for release preview command on maintenance branch."""
@@ -466,24 +354,12 @@ class TestReleasePreviewOnMaintenanceBranch:
     def test_release_preview_on_maintenance_branch_uses_tag_pattern(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/3.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/3.x')
 
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '3.2.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        cliff = patched_cliff('3.2.0')
 
         result = invoke(cli.app, ['release', 'preview'])
 
@@ -495,33 +371,6 @@ class TestReleasePreviewOnMaintenanceBranch:
         )
         assert '`3.2.0`' in result.stdout
 
-    def test_release_preview_on_maintenance_branch_version_mismatch_fails(
-        self,
-        mocker: MockerFixture,
-        tmp_path: Path,
-    ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
-
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.0.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
-
-        result = invoke(cli.app, ['release', 'preview'])
-
-        assert result.exit_code == 1
-        assert 'does not match maintenance branch' in result.output
-
 
 class TestReleaseNotesOnMaintenanceBranch:
     """Tests for release notes command on maintenance branch."""
@@ -529,25 +378,12 @@ class TestReleaseNotesOnMaintenanceBranch:
     def test_release_notes_on_maintenance_branch_uses_tag_pattern(
         self,
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/2.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/2.x')
 
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.7.0'
-        cliff.generate_unreleased_notes.return_value = '## 2.7.0\n\n- Fix\n'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        cliff = patched_cliff('2.7.0', notes='## 2.7.0\n\n- Fix\n')
         mocker.patch(
             'releez.subapps.release_notes.GitCliff',
             return_value=cliff,
@@ -567,29 +403,41 @@ class TestReleaseNotesOnMaintenanceBranch:
         )
         assert '## 2.7.0' in result.stdout
 
-    def test_release_notes_on_maintenance_branch_version_mismatch_fails(
+
+class TestMaintenanceVersionMismatch:
+    """Release commands fail when the next version leaves the maintenance major."""
+
+    @pytest.mark.parametrize(
+        'argv',
+        [
+            pytest.param(
+                [
+                    'release',
+                    'start',
+                    '--dry-run',
+                    '--maintenance-branch-regex',
+                    _SUPPORT_BRANCH_REGEX,
+                ],
+                id='start',
+            ),
+            pytest.param(['release', 'tag'], id='tag'),
+            pytest.param(['release', 'preview'], id='preview'),
+            pytest.param(['release', 'notes'], id='notes'),
+        ],
+    )
+    def test_version_mismatch_fails(
         self,
+        argv: list[str],
         mocker: MockerFixture,
-        tmp_path: Path,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
     ) -> None:
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
-
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.0.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        patched_release_repo('support/1.x')
+        patched_cliff('2.0.0')
+        # Only exercised by the tag subcommand; harmless for the others.
+        mocker.patch('releez.subapps.release_tag.fetch')
 
-        result = invoke(cli.app, ['release', 'notes'])
+        result = invoke(cli.app, argv)
 
         assert result.exit_code == 1
         assert 'does not match maintenance branch' in result.output
@@ -620,7 +468,7 @@ class TestMonorepoMaintenanceContext:
         p.tag_prefix = tag_prefix
         return p
 
-    _DEFAULT_REGEX = r'^support/(?P<major>\d+)\.x$'
+    _DEFAULT_REGEX = _SUPPORT_BRANCH_REGEX
 
     def test_returns_none_when_branch_is_none(
         self,
@@ -773,7 +621,7 @@ class TestValidateSupportBranchName:
             branch_name='support/1.x',
             tag_prefix='',
             major=1,
-            maintenance_regex=r'^support/(?P<major>\d+)\.x$',
+            maintenance_regex=_SUPPORT_BRANCH_REGEX,
         )
 
     def test_single_repo_mismatch_raises(self) -> None:
@@ -782,7 +630,7 @@ class TestValidateSupportBranchName:
                 branch_name='hotfix/1.x',
                 tag_prefix='',
                 major=1,
-                maintenance_regex=r'^support/(?P<major>\d+)\.x$',
+                maintenance_regex=_SUPPORT_BRANCH_REGEX,
             )
 
     def test_monorepo_valid_name_passes(self) -> None:
@@ -790,7 +638,7 @@ class TestValidateSupportBranchName:
             branch_name='support/ui-1.x',
             tag_prefix='ui-',
             major=1,
-            maintenance_regex=r'^support/(?P<major>\d+)\.x$',
+            maintenance_regex=_SUPPORT_BRANCH_REGEX,
         )
 
     def test_monorepo_with_prefix_group_regex_valid_passes(self) -> None:
@@ -834,7 +682,7 @@ class TestValidateSupportBranchName:
                 branch_name='hotfix/ui-1.x',
                 tag_prefix='ui-',
                 major=1,
-                maintenance_regex=r'^support/(?P<major>\d+)\.x$',
+                maintenance_regex=_SUPPORT_BRANCH_REGEX,
             )
 
 
@@ -861,21 +709,12 @@ class TestMonorepoReleaseStartOnMaintenanceBranch:
     def test_monorepo_release_start_on_maintenance_branch_uses_maintenance_tag_pattern(
         self,
         mocker: MockerFixture,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
         tmp_path: Path,
     ) -> None:
         """On support/ui-1.x, release start for project ui uses prefix-scoped tag pattern."""
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/ui-1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/ui-1.x')
         ui = self._mock_project(mocker, 'ui', 'ui-', tmp_path)
         mocker.patch(
             'releez.subapps.release._resolve_target_projects',
@@ -889,9 +728,7 @@ class TestMonorepoReleaseStartOnMaintenanceBranch:
             'releez.subapps.release._project_changelog_path',
             return_value=str(tmp_path / 'CHANGELOG.md'),
         )
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '1.5.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        patched_cliff('1.5.0')
         start_release = mocker.patch(
             'releez.subapps.release_start.start_release',
             return_value=mocker.Mock(
@@ -915,21 +752,11 @@ class TestMonorepoReleaseStartOnMaintenanceBranch:
     def test_monorepo_release_start_non_maintenance_branch_unaffected(
         self,
         mocker: MockerFixture,
+        patched_release_repo: ReleaseRepoPatcher,
         tmp_path: Path,
     ) -> None:
         """On master, monorepo release start for project ui has no maintenance tag pattern."""
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='master',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('master')
         ui = self._mock_project(mocker, 'ui', 'ui-', tmp_path)
         mocker.patch(
             'releez.subapps.release._resolve_target_projects',
@@ -965,21 +792,12 @@ class TestMonorepoReleaseStartOnMaintenanceBranch:
     def test_monorepo_release_start_maintenance_branch_version_mismatch_fails(
         self,
         mocker: MockerFixture,
+        patched_cliff: CliffPatcher,
+        patched_release_repo: ReleaseRepoPatcher,
         tmp_path: Path,
     ) -> None:
         """On support/ui-1.x, if git-cliff returns 2.x version, it should fail."""
-        repo_info = RepoInfo(
-            root=tmp_path,
-            remote_url='',
-            active_branch='support/ui-1.x',
-        )
-        mocker.patch(
-            'releez.subapps.release.open_repo',
-            return_value=mocker.Mock(
-                repo=mocker.Mock(spec=Repo),
-                info=repo_info,
-            ),
-        )
+        patched_release_repo('support/ui-1.x')
         ui = self._mock_project(mocker, 'ui', 'ui-', tmp_path)
         mocker.patch(
             'releez.subapps.release._resolve_target_projects',
@@ -989,9 +807,7 @@ class TestMonorepoReleaseStartOnMaintenanceBranch:
             'releez.subapps.release._project_include_paths',
             return_value=[],
         )
-        cliff = mocker.Mock()
-        cliff.compute_next_version.return_value = '2.0.0'
-        mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
+        patched_cliff('2.0.0')
 
         result = invoke(
             cli.app,
@@ -18,7 +18,7 @@ def test_projects_list_no_projects(
     mocker: MockerFixture,
 ) -> None:
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(projects=[]),
     )
 
@@ -41,7 +41,7 @@ def test_projects_list_with_projects(
     core_config.name = 'core'
 
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(projects=[core_config]),
     )
 
@@ -63,7 +63,7 @@ def test_projects_list_with_projects_no_include_paths(
     core_config.name = 'core'
 
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(projects=[core_config]),
     )
 
@@ -77,7 +77,7 @@ def test_projects_changed_no_projects_configured(
     mocker: MockerFixture,
 ) -> None:
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(projects=[]),
     )
 
@@ -102,7 +102,7 @@ def test_projects_changed_text_output_with_changes(
     )
     mock_settings.get_subprojects.return_value = [mock_project]
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mock_settings,
     )
     mocker.patch(
@@ -132,7 +132,7 @@ def test_projects_changed_text_output_no_changes(
     )
     mock_settings.get_subprojects.return_value = [mocker.MagicMock()]
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mock_settings,
     )
     mocker.patch(
@@ -165,7 +165,7 @@ def test_projects_changed_json_output(
     )
     mock_settings.get_subprojects.return_value = [mock_project]
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mock_settings,
     )
     mocker.patch(
@@ -199,7 +199,7 @@ def test_projects_changed_with_custom_base(
     )
     mock_settings.get_subprojects.return_value = [mocker.MagicMock()]
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mock_settings,
     )
     mocker.patch(
@@ -231,7 +231,7 @@ def test_projects_changed_handles_releez_error(
     )
     mock_settings.get_subprojects.return_value = [mocker.MagicMock()]
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mock_settings,
     )
     mocker.patch(
@@ -253,7 +253,7 @@ def test_projects_info_no_projects_configured(
     mocker: MockerFixture,
 ) -> None:
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(projects=[]),
     )
 
@@ -270,7 +270,7 @@ def test_projects_info_project_not_found(
     existing.name = 'ui'
 
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(projects=[existing]),
     )
 
@@ -295,7 +295,7 @@ def test_projects_info_valid_project(
     project_config.hooks.post_changelog = []
 
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(
             projects=[project_config],
             alias_versions='none',
@@ -325,7 +325,7 @@ def test_projects_info_with_post_changelog_hooks(
     ]
 
     mocker.patch(
-        'releez.subapps.projects.ReleezSettings',
+        'releez.subapps.projects.get_settings',
         return_value=mocker.MagicMock(
             projects=[project_config],
             alias_versions='none',
@@ -57,7 +57,7 @@ def test_cli_release_detect_from_branch_monorepo(
     mock_settings = mocker.MagicMock(projects=[mocker.MagicMock()])
     mock_settings.get_subprojects.return_value = [mocker.MagicMock()]
     mocker.patch(
-        'releez.subapps.release_support.ReleezSettings',
+        'releez.subapps.release_support.get_settings',
         return_value=mock_settings,
     )
 
@@ -33,7 +33,7 @@ def _mock_settings(
         projects=projects,
     )
     mocker.patch(
-        'releez.subapps.release_notes.ReleezSettings',
+        'releez.subapps.release_notes.get_settings',
         return_value=mock_settings,
     )
     return mock_settings
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 from invoke_helper import invoke
 
 from releez import cli
@@ -33,15 +34,17 @@ def _mock_settings(
         projects=projects,
     )
     mocker.patch(
-        'releez.subapps.release_preview.ReleezSettings',
+        'releez.subapps.release_preview.get_settings',
         return_value=mock_settings,
     )
     return mock_settings
 
 
-def test_cli_release_preview_writes_markdown(
+@pytest.mark.parametrize('use_output_file', [True, False], ids=['file', 'stdout'])
+def test_cli_release_preview_emits_markdown(
     mocker: MockerFixture,
     tmp_path: Path,
+    use_output_file: bool,  # noqa: FBT001
 ) -> None:
     repo_root = tmp_path / 'repo'
     repo_root.mkdir()
@@ -58,21 +61,15 @@ def test_cli_release_preview_writes_markdown(
     cliff.compute_next_version.return_value = '2.3.4'
     mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
 
+    argv = ['release', 'preview', '--alias-versions', 'major']
     output = tmp_path / 'preview.md'
-    result = invoke(
-        cli.app,
-        [
-            'release',
-            'preview',
-            '--alias-versions',
-            'major',
-            '--output',
-            str(output),
-        ],
-    )
+    if use_output_file:
+        argv += ['--output', str(output)]
+
+    result = invoke(cli.app, argv)
 
     assert result.exit_code == 0
-    content = output.read_text(encoding='utf-8')
+    content = output.read_text(encoding='utf-8') if use_output_file else result.stdout
     assert '## `releez` release preview' in content
     assert '`2.3.4`' in content
 
@@ -108,32 +105,6 @@ def test_cli_release_preview_delegates_to_command_helper(
     assert call_kwargs['all_projects'] is False
 
 
-def test_cli_release_preview_stdout(
-    mocker: MockerFixture,
-    tmp_path: Path,
-) -> None:
-    repo_root = tmp_path / 'repo'
-    repo_root.mkdir()
-
-    mocker.patch(
-        'releez.subapps.release.open_repo',
-        return_value=mocker.Mock(
-            repo=mocker.MagicMock(),
-            info=mocker.Mock(root=repo_root, active_branch=None),
-        ),
-    )
-
-    cliff = mocker.Mock()
-    cliff.compute_next_version.return_value = '1.2.3'
-    mocker.patch('releez.cli_utils.GitCliff', return_value=cliff)
-
-    result = invoke(cli.app, ['release', 'preview', '--alias-versions', 'none'])
-
-    assert result.exit_code == 0
-    assert '## `releez` release preview' in result.stdout
-    assert '`1.2.3`' in result.stdout
-
-
 def test_cli_release_preview_monorepo_requires_project_selection(
     mocker: MockerFixture,
     tmp_path: Path,
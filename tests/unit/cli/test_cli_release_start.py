@@ -47,7 +47,7 @@ def _mock_settings(
         projects=projects,
     )
     mocker.patch(
-        'releez.subapps.release_start.ReleezSettings',
+        'releez.subapps.release_start.get_settings',
         return_value=mock_settings,
     )
     return mock_settings
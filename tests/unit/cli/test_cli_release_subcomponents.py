@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -239,8 +240,7 @@ def test_run_release_preview_command_uses_single_repo_builder(
             alias_versions=AliasVersions.none,
             output=None,
         ),
-        repo_root=Path('/repo'),
-        tag_pattern=None,
+        version=VersionInfo.parse('1.2.3'),
     )
     emit_output.assert_called_once_with(output=None, content='preview')
 
@@ -306,18 +306,19 @@ def test_run_release_start_command_exits_when_monorepo_targets_empty(
     run_mono.assert_not_called()
 
 
-def test_project_semver_version_strips_prefix_when_present(
+def test_emit_or_write_output_uses_console_on_tty(
     mocker: MockerFixture,
 ) -> None:
-    """When git-cliff returns a prefixed tag (e.g. 'core-1.2.3'), the prefix is stripped."""
-    project = mocker.MagicMock()
-    project.tag_prefix = 'core-'
+    """A real terminal goes through the rich console, not the raw-write fast path."""
+    stdout = mocker.Mock()
+    stdout.isatty.return_value = True
+    mocker.patch.object(sys, 'stdout', stdout)
+    console_print = mocker.patch.object(release.console, 'print')
 
-    result = release._project_semver_version(
-        project=project,
-        version=VersionInfo.parse('1.2.3'),
-    )
-    assert result == '1.2.3'
+    release._emit_or_write_output(output=None, content='# notes')
+
+    console_print.assert_called_once_with('# notes', markup=False)
+    stdout.write.assert_not_called()
 
 
 def test_run_project_release_start_prompts_confirmation_on_maintenance_branch(
@@ -404,7 +404,7 @@ class TestSupportBranchSingleRepo:
         mock_settings.projects = []
         mock_settings.get_subprojects.return_value = []
         mocker.patch(
-            'releez.subapps.release_support.ReleezSettings',
+            'releez.subapps.release_support.get_settings',
             return_value=mock_settings,
         )
 
@@ -448,7 +448,7 @@ class TestSupportBranchMonorepo:
         mock_settings = self._mock_settings(mocker)
         mock_settings.get_subprojects.return_value = [ui]
         mocker.patch(
-            'releez.subapps.release_support.ReleezSettings',
+            'releez.subapps.release_support.get_settings',
             return_value=mock_settings,
         )
         mocker.patch(
@@ -521,7 +521,7 @@ class TestSupportBranchMonorepo:
         mock_settings = self._mock_settings(mocker)
         mock_settings.get_subprojects.return_value = [ui]
         mocker.patch(
-            'releez.subapps.release_support.ReleezSettings',
+            'releez.subapps.release_support.get_settings',
             return_value=mock_settings,
         )
 
@@ -595,7 +595,7 @@ class TestSupportBranchMonorepo:
         mock_settings = self._mock_settings(mocker)
         mock_settings.get_subprojects.return_value = [ui]
         mocker.patch(
-            'releez.subapps.release_support.ReleezSettings',
+            'releez.subapps.release_support.get_settings',
             return_value=mock_settings,
         )
         mocker.patch(
@@ -38,7 +38,7 @@ def _mock_settings(
         projects=projects,
     )
     mocker.patch(
-        'releez.subapps.version.ReleezSettings',
+        'releez.subapps.version.get_settings',
         return_value=mock_settings,
     )
     return mock_settings
@@ -1,13 +1,48 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
-from releez.errors import InvalidGitHubRemoteError
-from releez.github import _github_api_base_url_from_env, _parse_github_full_name
+from releez.errors import InvalidGitHubRemoteError, MissingGitHubDependencyError
+from releez.github import (
+    PullRequest,
+    PullRequestCreateRequest,
+    _github_api_base_url_from_env,
+    _github_client,
+    _parse_github_full_name,
+    create_pull_request,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize(
+    'remote_url',
+    [
+        pytest.param('https://github.com/org/repo.git', id='https'),
+        pytest.param('http://github.com/org/repo', id='http-no-suffix'),
+        pytest.param('git@github.com:org/repo.git', id='scp-ssh'),
+        pytest.param('ssh://git@github.com/org/repo.git', id='ssh-url'),
+    ],
+)
+def test_parse_github_full_name_supported_formats(remote_url: str) -> None:
+    assert _parse_github_full_name(remote_url) == 'org/repo'
 
 
-def test_parse_github_full_name_https_github_com() -> None:
-    assert _parse_github_full_name('https://github.com/org/repo.git') == 'org/repo'
+@pytest.mark.parametrize(
+    'remote_url',
+    [
+        pytest.param('ftp://github.com/org/repo.git', id='unrecognized-scheme'),
+        pytest.param('git@github.com/org/repo.git', id='scp-missing-colon'),
+        pytest.param('https://github.com/org/repo/extra.git', id='extra-path-segment'),
+        pytest.param('https://github.com/org.git', id='missing-repo'),
+    ],
+)
+def test_parse_github_full_name_rejects_malformed_remotes(remote_url: str) -> None:
+    with pytest.raises(InvalidGitHubRemoteError):
+        _parse_github_full_name(remote_url)
 
 
 def test_parse_github_full_name_supports_github_server_url_env(
@@ -39,3 +74,89 @@ def test_github_api_base_url_derives_from_server_url(
     monkeypatch.delenv('GITHUB_API_URL', raising=False)
     monkeypatch.setenv('GITHUB_SERVER_URL', 'https://ghe.example.com/')
     assert _github_api_base_url_from_env() == 'https://ghe.example.com/api/v3'
+
+
+@pytest.fixture(autouse=True)
+def _clear_github_client_cache() -> None:
+    # _github_client is lru_cached; clear it so mocks never leak between tests.
+    _github_client.cache_clear()
+
+
+def test_github_client_default_api(mocker: MockerFixture) -> None:
+    github_cls = mocker.patch('github.Github')
+
+    client = _github_client(token='tok', base_url=None)
+
+    github_cls.assert_called_once_with('tok')
+    assert client is github_cls.return_value
+
+
+def test_github_client_custom_base_url(mocker: MockerFixture) -> None:
+    github_cls = mocker.patch('github.Github')
+
+    _github_client(token='tok', base_url='https://ghe.example.com/api/v3')
+
+    github_cls.assert_called_once_with(
+        login_or_token='tok',
+        base_url='https://ghe.example.com/api/v3',
+    )
+
+
+def test_github_client_missing_dependency(mocker: MockerFixture) -> None:
+    mocker.patch.dict('sys.modules', {'github': None})
+
+    with pytest.raises(MissingGitHubDependencyError):
+        _github_client(token='tok', base_url=None)
+
+
+def _make_pr_request(labels: list[str]) -> PullRequestCreateRequest:
+    return PullRequestCreateRequest(
+        remote_url='git@github.com:org/repo.git',
+        token='tok',
+        base='master',
+        head='release/1.2.3',
+        title='chore(release): 1.2.3',
+        body='notes',
+        labels=labels,
+    )
+
+
+def test_create_pull_request_wires_client_and_maps_result(
+    mocker: MockerFixture,
+) -> None:
+    client_factory = mocker.patch('releez.github._github_client')
+    mocker.patch(
+        'releez.github._github_api_base_url_from_env',
+        return_value='https://ghe.example.com/api/v3',
+    )
+    gh = client_factory.return_value
+    created = gh.get_repo.return_value.create_pull.return_value
+    created.html_url = 'https://github.com/org/repo/pull/7'
+    created.number = 7
+
+    result = create_pull_request(_make_pr_request(labels=['release']))
+
+    client_factory.assert_called_once_with(
+        token='tok',
+        base_url='https://ghe.example.com/api/v3',
+    )
+    gh.get_repo.assert_called_once_with('org/repo')
+    gh.get_repo.return_value.create_pull.assert_called_once_with(
+        title='chore(release): 1.2.3',
+        body='notes',
+        base='master',
+        head='release/1.2.3',
+    )
+    created.add_to_labels.assert_called_once_with('release')
+    assert result == PullRequest(url='https://github.com/org/repo/pull/7', number=7)
+
+
+def test_create_pull_request_skips_labels_when_empty(
+    mocker: MockerFixture,
+) -> None:
+    client_factory = mocker.patch('releez.github._github_client')
+    created = client_factory.return_value.get_repo.return_value.create_pull.return_value
+
+    create_pull_request(_make_pr_request(labels=[]))
+
+    created.add_to_labels.assert_not_called()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+import releez
+import releez.subapps
+from releez.git_repo import DetectedRelease, detect_release_from_branch
+from releez.subapps.version import version_app
+
+
+def test_releez_lazily_resolves_git_repo_exports() -> None:
+    assert releez.DetectedRelease is DetectedRelease
+    assert releez.detect_release_from_branch is detect_release_from_branch
+
+
+def test_releez_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match='no attribute'):
+        _ = releez.missing
+
+
+def test_subapps_lazily_resolves_app_exports() -> None:
+    assert releez.subapps.version_app is version_app
+
+
+def test_subapps_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError, match='no attribute'):
+        _ = releez.subapps.missing
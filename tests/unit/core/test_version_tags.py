@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pytest
+from semver import VersionInfo
 
 from releez.errors import InvalidReleaseVersionError
 from releez.version_tags import compute_version_tags
@@ -16,12 +17,14 @@ def test_compute_version_tags_exact_never_v_prefixed() -> None:
 @pytest.mark.parametrize(
     'version',
     [
-        '2.3',
-        '2.3.4.5',
-        '2.3.4-rc.1',
-        '2.3.4+99',
-        'v2.3',
-        'not-a-version',
+        pytest.param('2.3', id='missing-patch'),
+        pytest.param('2.3.4.5', id='too-many-components'),
+        pytest.param('2.3.4-rc.1', id='prerelease'),
+        pytest.param('2.3.4+99', id='build-metadata'),
+        pytest.param('v2.3', id='prefixed-missing-patch'),
+        pytest.param('not-a-version', id='not-a-version'),
+        pytest.param('١.٢.٣', id='non-ascii-digits'),
+        pytest.param('¹.2.3', id='superscript-digit'),
     ],
 )
 def test_compute_version_tags_rejects_invalid_versions(version: str) -> None:
@@ -29,6 +32,27 @@ def test_compute_version_tags_rejects_invalid_versions(version: str) -> None:
         compute_version_tags(version=version)
 
 
+@pytest.mark.parametrize(
+    'version',
+    [
+        pytest.param(VersionInfo.parse('1.2.3-rc.1'), id='prerelease'),
+        pytest.param(VersionInfo.parse('1.2.3+99'), id='build-metadata'),
+    ],
+)
+def test_compute_version_tags_rejects_non_release_version_info(
+    version: VersionInfo,
+) -> None:
+    with pytest.raises(InvalidReleaseVersionError):
+        compute_version_tags(version=version)
+
+
+def test_compute_version_tags_accepts_version_info() -> None:
+    tags = compute_version_tags(version=VersionInfo.parse('1.2.3'), tag_prefix='core-')
+    assert tags.exact == 'core-1.2.3'
+    assert tags.major == 'core-v1'
+    assert tags.minor == 'core-v1.2'
+
+
 def test_compute_version_tags_with_prefix() -> None:
     """Test that tag prefix is applied to all tags."""
     tags = compute_version_tags(version='1.2.3', tag_prefix='core-')